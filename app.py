@@ -5,6 +5,8 @@ import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 import sqlite3
 import os
+import re
+import csv
 from pathlib import Path
 
 class ResponsiveFrame(ttk.Frame):
@@ -24,6 +26,9 @@ class ResponsiveFrame(ttk.Frame):
 class DatabaseManager:
     """Manager for connections and operations with the SQLite database."""
     
+    # Size of the per-connection prepared statement cache (sqlite3 default is 128)
+    STATEMENT_CACHE_SIZE = 256
+    
     def __init__(self) -> None:
         """Initializes the database manager."""
         self.connection: Optional[sqlite3.Connection] = None
@@ -45,7 +50,7 @@ class DatabaseManager:
             if self.connection:
                 self.close()
                 
-            self.connection = sqlite3.connect(db_path)
+            self.connection = sqlite3.connect(db_path, cached_statements=self.STATEMENT_CACHE_SIZE)
             self.cursor = self.connection.cursor()
             self.current_db_path = db_path
             self._update_db_info()
@@ -83,12 +88,13 @@ class DatabaseManager:
             self.cursor = None
             self.current_db_path = None
     
-    def execute_query(self, query: str) -> Tuple[bool, Union[List[Tuple], str], Optional[List[str]]]:
+    def execute_query(self, query: str, params: Optional[Union[Dict[str, Any], Tuple]] = None) -> Tuple[bool, Union[List[Tuple], str], Optional[List[str]]]:
         """  
         Executes an SQL query.  
 
         Args:  
             query: SQL query to be executed  
+            params: Values bound to the ?, :name, @name or $name placeholders of the query  
 
         Returns:  
             Tuple containing:  
@@ -100,7 +106,7 @@ class DatabaseManager:
             return False, "There is no active connection to the database", None
         
         try:
-            self.cursor.execute(query)
+            self.cursor.execute(query, params if params is not None else ())
             
             # Check if it is a SELECT query or similar that returns data.
             if query.strip().upper().startswith(("SELECT", "PRAGMA", "SHOW")):
@@ -121,6 +127,74 @@ class DatabaseManager:
         except sqlite3.Error as e:
             return False, f"Error executing query: {e}", None
     
+    def execute_many(self, query: str, param_sets: Union[List[Dict[str, Any]], List[Tuple]]) -> Tuple[bool, str]:
+        """
+        Executes a DML query once per parameter set in a single transaction.
+
+        Args:
+            query: SQL query with ?, :name, @name or $name placeholders
+            param_sets: Values bound to the placeholders on each execution
+
+        Returns:
+            Tuple containing:
+                bool: True if successful, False otherwise
+                str: Status or error message
+        """
+        if not self.connection or not self.cursor:
+            return False, "There is no active connection to the database"
+        
+        try:
+            self.cursor.executemany(query, param_sets)
+            self.connection.commit()
+            return True, f"Batch executed successfully. Parameter sets: {len(param_sets)}. Rows affected: {self.cursor.rowcount}"
+        except sqlite3.Error as e:
+            self.connection.rollback()
+            return False, f"Error executing batch: {e}"
+    
+    def apply_changes(self, table_name: str, key_columns: List[str], changes: Dict[str, List[Tuple]]) -> Tuple[bool, str]:
+        """
+        Applies a batch of cell edits to a table in a single transaction.
+
+        Args:
+            table_name: Name of the table being edited
+            key_columns: Columns that identify a row (primary key or rowid)
+            changes: Mapping of column name to parameter tuples (new_value, *key_values),
+                each expected to update exactly one row
+
+        Returns:
+            Tuple containing:
+                bool: True if successful, False otherwise
+                str: Status or error message
+        """
+        if not self.connection or not self.cursor:
+            return False, "There is no active connection to the database"
+        
+        where_clause = " AND ".join(f"{self._quote_identifier(col)} = ?" for col in key_columns)
+        rows_affected = 0
+        
+        try:
+            # One statement per edited column, each run over all of its rows with executemany.
+            for column, params in changes.items():
+                self.cursor.executemany(
+                    f"UPDATE {self._quote_identifier(table_name)} SET {self._quote_identifier(column)} = ? WHERE {where_clause}",
+                    params
+                )
+                rows_affected += self.cursor.rowcount
+            
+            # Every change must hit exactly one row. Fewer means rows were deleted or their keys changed since the query.
+            expected_rows = sum(len(params) for params in changes.values())
+            if rows_affected != expected_rows:
+                self.connection.rollback()
+                return False, (f"Only {rows_affected} of {expected_rows} changes matched a row. The rows may have been "
+                               "changed or deleted since the query. No changes were applied.")
+            
+            # A single commit for the whole batch.
+            self.connection.commit()
+            return True, f"Changes applied successfully. Rows affected: {rows_affected}"
+        except sqlite3.Error as e:
+            self.connection.rollback()
+            return False, f"Error applying changes: {e}"
+    
     def get_tables(self) -> List[str]:
         """
         Gets the list of tables from the current database.
@@ -153,13 +227,87 @@ class DatabaseManager:
             return []
         
         try:
-            self.cursor.execute(f"PRAGMA table_info({table_name})")
+            self.cursor.execute(f"PRAGMA table_info({self._quote_identifier(table_name)})")
             columns = [(row[1], row[2]) for row in self.cursor.fetchall()]  # (name, type)
             return columns
         except sqlite3.Error as e:
             print(f"Error retrieving table information: {e}")
             return []
     
+    def get_primary_key(self, table_name: str) -> List[str]:
+        """
+        Gets the primary key columns of a table.
+
+        Args:
+        table_name: Name of the table
+
+        Returns:
+        List[str]: Primary key column names in key order (empty if the table has none)
+        """
+        if not self.connection or not self.cursor:
+            return []
+        
+        try:
+            self.cursor.execute(f"PRAGMA table_info({self._quote_identifier(table_name)})")
+            key_columns = sorted((row[5], row[1]) for row in self.cursor.fetchall() if row[5] > 0)  # (pk, name)
+            return [name for _, name in key_columns]
+        except sqlite3.Error as e:
+            print(f"Error retrieving primary key: {e}")
+            return []
+    
+    @staticmethod
+    def get_type_affinity(declared_type: str) -> str:
+        """
+        Gets the SQLite type affinity of a declared column type.
+
+        Args:
+        declared_type: Type as declared in CREATE TABLE (may be empty)
+
+        Returns:
+        str: "INTEGER", "TEXT", "BLOB", "REAL" or "NUMERIC"
+        """
+        declared_type = declared_type.upper()
+        if "INT" in declared_type:
+            return "INTEGER"
+        if any(name in declared_type for name in ("CHAR", "CLOB", "TEXT")):
+            return "TEXT"
+        if "BLOB" in declared_type or not declared_type:
+            return "BLOB"
+        if any(name in declared_type for name in ("REAL", "FLOA", "DOUB")):
+            return "REAL"
+        return "NUMERIC"
+    
+    @staticmethod
+    def get_query_parameters(query: str) -> List[str]:
+        """
+        Gets the placeholders of a query.
+
+        Args:
+        query: SQL query
+
+        Returns:
+        List[str]: Named placeholders as written (:name, @name, $name) and positional ones
+        as ?N with their index (a bare ? takes the next index), in order of first appearance
+        """
+        # Ignore string literals, quoted identifiers and comments
+        stripped = re.sub(r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|--[^\n]*|/\*.*?\*/", " ", query, flags=re.DOTALL)
+        
+        parameters: List[str] = []
+        next_index = 1
+        for token in re.findall(r"(?<![\w:@$?])([:@$][A-Za-z_]\w*|\?\d*)", stripped):
+            if token == "?":
+                token = f"?{next_index}"
+            if token.startswith("?"):
+                next_index = max(next_index, int(token[1:]) + 1)
+            if token not in parameters:
+                parameters.append(token)
+        return parameters
+    
+    @staticmethod
+    def _quote_identifier(name: str) -> str:
+        """Quotes an SQL identifier (table or column name)."""
+        return '"' + name.replace('"', '""') + '"'
+    
     def _update_db_info(self) -> None:
         """Updates information about the current database."""
         if not self.connection or not self.cursor:
@@ -183,6 +331,9 @@ class ApplicationUI:
     Implements a responsive layout according to the provided specifications.  
     """
     
+    # How a query parameter typed in the form is bound: number when it looks like one, always text, or NULL
+    PARAMETER_TYPES = ("Auto", "Text", "NULL")
+    
     def __init__(self, root: tk.Tk, db_manager: DatabaseManager) -> None:
         """  
         Initializes the application interface.  
@@ -205,6 +356,21 @@ class ApplicationUI:
         # Dictionary to store button references
         self.buttons: Dict[str, ttk.Button] = {}
         
+        # State of the results grid used for inline editing
+        self.result_rows: Dict[str, Tuple] = {}  # Original values per treeview item
+        self.edit_table: Optional[str] = None  # Source table when the results are editable
+        self.edit_key_columns: List[str] = []  # Primary key columns (or rowid) of the source table
+        self.edit_key_indices: List[int] = []  # Result columns holding the key values
+        self.result_sources: List[Optional[str]] = []  # Table column behind each result column (None if not editable)
+        self.edit_column_types: Dict[str, str] = {}  # Declared type of each column of the source table
+        self.pending_changes: Dict[Tuple[str, int], Any] = {}  # (item, column index) -> new value
+        self.cell_editor: Optional[ttk.Entry] = None
+        self.cell_editor_text = ""  # Text shown when the cell editor was opened
+        
+        # Last type and value typed for each query parameter (:name, @name, $name or ?N)
+        self.query_params: Dict[str, Tuple[str, str]] = {}
+        self.parameters_form: Optional[ttk.Toplevel] = None
+        
         # Configuration for responsive resizing
         self.root.grid_columnconfigure(0, weight=1)
         self.root.grid_rowconfigure(0, weight=1)
@@ -330,6 +496,9 @@ class ApplicationUI:
         )
         
         if file_path:
+            if not self._confirm_discard_pending_changes():
+                return
+            self._reset_results_state()
             if self.db_manager.create_database(file_path):
                 self.status_var.set(f"Database created: {os.path.basename(file_path)}")
                 self._update_db_tree()
@@ -354,6 +523,9 @@ CREATE TABLE clients (
         )
         
         if file_path:
+            if not self._confirm_discard_pending_changes():
+                return
+            self._reset_results_state()
             if self.db_manager.connect(file_path):
                 self.status_var.set(f"Connected to the database: {os.path.basename(file_path)}")
                 self._update_db_tree()
@@ -363,6 +535,9 @@ CREATE TABLE clients (
     def _close_database(self) -> None:
         """Closes the current connection to the database."""
         if self.db_manager.current_db_path:
+            if not self._confirm_discard_pending_changes():
+                return
+            self._reset_results_state()
             self.db_manager.close()
             self.status_var.set("Database connection closed")
             self._clear_db_tree()
@@ -472,14 +647,18 @@ CREATE TABLE clients (
         # If a table is selected, generate a SELECT query
         if item_type == "table" and len(item_values) > 1:
             table_name = item_values[1]
+            # Tables without a primary key also select the rowid so the results can be edited
+            columns = "*" if self.db_manager.get_primary_key(table_name) else "rowid, *"
             self.query_text.delete(1.0, tk.END)
-            self.query_text.insert(tk.END, f"SELECT * FROM {table_name} LIMIT 100;")
+            self.query_text.insert(tk.END, f"SELECT {columns} FROM {table_name} LIMIT :limit;")
+            self.query_params.setdefault(":limit", ("Auto", "100"))
         
         # If a view is selected, generate a SELECT query
         elif item_type == "view" and len(item_values) > 1:
             view_name = item_values[1]
             self.query_text.delete(1.0, tk.END)
-            self.query_text.insert(tk.END, f"SELECT * FROM {view_name} LIMIT 100;")
+            self.query_text.insert(tk.END, f"SELECT * FROM {view_name} LIMIT :limit;")
+            self.query_params.setdefault(":limit", ("Auto", "100"))
             
     def _setup_main_content(self) -> None:
         """Sets up the main content area (divided into blue and red in the reference)."""
@@ -537,6 +716,14 @@ CREATE TABLE clients (
         )
         self.clear_button.pack(side=LEFT, padx=5)
         
+        self.parameters_button = ttk.Button(
+            self.query_buttons_frame,
+            text="Parameters",
+            bootstyle="primary-outline",
+            command=self._open_parameters_form
+        )
+        self.parameters_button.pack(side=LEFT, padx=5)
+        
         # Bottom section (red in the reference) - For results
         self.lower_content = ResponsiveFrame(
             self.content_container,
@@ -590,6 +777,38 @@ CREATE TABLE clients (
         self.results_frame.grid_rowconfigure(0, weight=1)
         self.results_frame.grid_columnconfigure(0, weight=1)
         
+        # Inline editing of result cells
+        self.results_tree.tag_configure("edited", foreground=self.style.colors.warning)
+        self.results_tree.bind("<Double-1>", self._on_result_double_click)
+        
+        # Buttons for the pending changeset
+        self.results_buttons_frame = ttk.Frame(self.lower_content)
+        self.results_buttons_frame.pack(fill=X, pady=(5, 0))
+        
+        self.apply_changes_button = ttk.Button(
+            self.results_buttons_frame,
+            text="Apply Changes",
+            bootstyle="danger",
+            command=self._apply_pending_changes
+        )
+        self.apply_changes_button.pack(side=LEFT, padx=5)
+        
+        self.review_changes_button = ttk.Button(
+            self.results_buttons_frame,
+            text="Review Changes",
+            bootstyle="danger-outline",
+            command=self._review_pending_changes
+        )
+        self.review_changes_button.pack(side=LEFT, padx=5)
+        
+        self.discard_changes_button = ttk.Button(
+            self.results_buttons_frame,
+            text="Discard Changes",
+            bootstyle="danger-outline",
+            command=self._discard_pending_changes
+        )
+        self.discard_changes_button.pack(side=LEFT, padx=5)
+        
     def _execute_query(self) -> None:
         """Executes the SQL query from the text area and displays the results."""
         if not self.db_manager.current_db_path:
@@ -602,9 +821,50 @@ CREATE TABLE clients (
             messagebox.showwarning("Warning", "Empty query.")
             return
         
-        success, result, column_names = self.db_manager.execute_query(query)
+        # Queries with parameters are bound to the values from the parameters form.
+        # Statements other than SELECT/PRAGMA always go through the form, so stale values are never reused unseen.
+        parameter_names = self.db_manager.get_query_parameters(query)
+        if not self._check_parameters(parameter_names):
+            return
         
+        read_only = query.upper().startswith(("SELECT", "PRAGMA"))
+        if parameter_names and (not read_only or any(name not in self.query_params for name in parameter_names)):
+            self._open_parameters_form()
+            return
+        
+        self._run_query(query, self._bind_parameters(parameter_names) if parameter_names else None)
+    
+    def _run_query(self, query: str, params: Optional[Union[Dict[str, Any], Tuple]] = None) -> None:
+        """
+        Executes a query and displays the results.
+
+        Args:
+            query: SQL query to be executed
+            params: Values bound to the parameters of the query
+        """
+        if not self._confirm_discard_pending_changes():
+            return
+        
+        success, result, column_names = self.db_manager.execute_query(query, params)
+        self._show_query_result(query, success, result, column_names)
+        
+        # Show the bound values, so reused parameters never go unnoticed
+        if params:
+            self.status_var.set(f"{self.status_var.get()} | Parameters: {self._format_parameters(params)}")
+    
+    def _show_query_result(self, query: str, success: bool, result: Union[List[Tuple], str], column_names: Optional[List[str]]) -> None:
+        """
+        Displays the result of a query in the results tree.
+
+        Args:
+            query: SQL query that was executed
+            success: Whether the query succeeded
+            result: Rows or message returned by the database manager
+            column_names: Column names of the rows, if any
+        """
         if success:
+            self._reset_results_state()
+            
             if isinstance(result, list):
                 # Clears the results tree
                 for col in self.results_tree["columns"]:
@@ -633,7 +893,10 @@ CREATE TABLE clients (
                 for row in result:
                     # Convert all values to string (to avoid issues with None, etc.)
                     string_row = [str(value) if value is not None else "" for value in row]
-                    self.results_tree.insert("", tk.END, values=string_row)
+                    item_id = self.results_tree.insert("", tk.END, values=string_row)
+                    self.result_rows[item_id] = row
+                
+                self._detect_editable_source(query, column_names)
                 
                 self.status_var.set(f"Consulta executada com sucesso. {len(result)} registros encontrados.")
                 
@@ -642,19 +905,7 @@ CREATE TABLE clients (
                     self._update_db_tree()
             else:
                 # The result is a message
-                self.status_var.set(result)
-                
-                # Configure the treeview with a single column to display the message
-                for col in self.results_tree["columns"]:
-                    self.results_tree.heading(col, text="")
-                
-                for item in self.results_tree.get_children():
-                    self.results_tree.delete(item)
-                
-                self.results_tree["columns"] = ["message"]
-                self.results_tree.heading("message", text="Mensagem")
-                self.results_tree.column("message", width=400)
-                self.results_tree.insert("", tk.END, values=[result])
+                self._show_result_message(result)
                 
                 # Update the navigation tree after commands that modify the structure
                 if any(cmd in query.strip().upper() for cmd in ["CREATE", "DROP", "ALTER"]):
@@ -664,6 +915,637 @@ CREATE TABLE clients (
             messagebox.showerror("Erro SQL", result)
             self.status_var.set("Erro ao executar consulta.")
         
+    def _detect_editable_source(self, query: str, column_names: List[str]) -> None:
+        """
+        Enables inline editing when the results come from a single table and include its key.
+
+        Args:
+            query: SQL query that produced the results
+            column_names: Column names of the results
+        """
+        match = re.match(
+            r"\s*SELECT\s+(?:(?:DISTINCT|ALL)\s+)?(.+?)\s+FROM\s+[\"\[`]?(\w+)[\"\]`]?\s*(?:WHERE\b|ORDER\b|LIMIT\b|;|$)",
+            query,
+            re.IGNORECASE | re.DOTALL
+        )
+        if not match:
+            return
+        
+        # Compound and grouped queries mix or merge rows, so their results cannot be mapped back to table rows
+        tail = self._top_level_text(query[match.end():])
+        if re.search(r"\b(?:UNION|INTERSECT|EXCEPT|GROUP|HAVING|WINDOW)\b", tail, re.IGNORECASE):
+            return
+        
+        tables = {name.lower(): name for name in self.db_manager.db_info.get('tables', [])}
+        table_name = tables.get(match.group(2).lower())
+        if not table_name:
+            return
+        
+        table_info = self.db_manager.get_table_info(table_name)
+        table_columns = [name for name, _ in table_info]
+        column_lookup = {name.lower(): name for name in table_columns}
+        key_columns = self.db_manager.get_primary_key(table_name) or ["rowid"]
+        
+        # Map each result column to the table column it comes from.
+        # Aliases and expressions map to None, so they can neither be edited nor act as keys.
+        sources: List[Optional[str]] = []
+        for item in self._split_select_list(match.group(1)):
+            item_match = re.fullmatch(r"(?:[\"\[`]?\w+[\"\]`]?\.)?(\*|[\"\[`]?(\w+)[\"\]`]?)", item.strip())
+            if not item_match:
+                sources.append(None)
+            elif item_match.group(1) == "*":
+                sources.extend(table_columns)
+            elif item_match.group(2).lower() in column_lookup:
+                sources.append(column_lookup[item_match.group(2).lower()])
+            elif item_match.group(2).lower() in ("rowid", "oid", "_rowid_") and key_columns == ["rowid"]:
+                sources.append("rowid")
+            else:
+                sources.append(None)
+        
+        if len(sources) != len(column_names) or not all(col in sources for col in key_columns):
+            return
+        
+        self.edit_table = table_name
+        self.edit_key_columns = key_columns
+        self.edit_key_indices = [sources.index(col) for col in key_columns]
+        self.result_sources = sources
+        self.edit_column_types = dict(table_info, rowid="INTEGER")
+    
+    @staticmethod
+    def _top_level_text(sql: str) -> str:
+        """
+        Removes string literals, quoted identifiers and parenthesised parts (such as subqueries) from SQL text.
+
+        Args:
+            sql: SQL text
+
+        Returns:
+            str: Text left at the top level, with each removed part replaced by a space
+        """
+        kept: List[str] = []
+        depth = 0
+        quote: Optional[str] = None
+        
+        for char in sql:
+            if quote:
+                if char == quote:
+                    quote = None
+                continue
+            if char in "'\"`":
+                quote = char
+            elif char == "[":
+                quote = "]"
+            elif char == "(":
+                depth += 1
+            elif char == ")":
+                depth -= 1
+            elif depth == 0:
+                kept.append(char)
+                continue
+            kept.append(" ")
+        
+        return "".join(kept)
+    
+    @staticmethod
+    def _split_select_list(select_list: str) -> List[str]:
+        """
+        Splits the column list of a SELECT on its top-level commas.
+
+        Args:
+            select_list: Text between SELECT and FROM
+
+        Returns:
+            List[str]: One entry per selected column or expression
+        """
+        items: List[str] = []
+        current: List[str] = []
+        depth = 0
+        quote: Optional[str] = None
+        
+        for char in select_list:
+            if quote:
+                if char == quote:
+                    quote = None
+            elif char in "'\"`":
+                quote = char
+            elif char == "[":
+                quote = "]"
+            elif char == "(":
+                depth += 1
+            elif char == ")":
+                depth -= 1
+            elif char == "," and depth == 0:
+                items.append("".join(current))
+                current = []
+                continue
+            current.append(char)
+        
+        items.append("".join(current))
+        return items
+    
+    def _on_result_double_click(self, event) -> None:
+        """
+        Opens an editor over the double-clicked result cell.
+
+        Args:
+            event: Mouse event
+        """
+        item_id = self.results_tree.identify_row(event.y)
+        column_ref = self.results_tree.identify_column(event.x)  # "#1", "#2", ...
+        if not item_id or not column_ref or item_id not in self.result_rows:
+            return
+        
+        if not self.edit_table:
+            self.status_var.set("These results are not editable. Select from a single table including its primary key or rowid.")
+            return
+        
+        column_index = int(column_ref[1:]) - 1
+        if column_index in self.edit_key_indices or self.result_sources[column_index] in self.edit_key_columns:
+            self.status_var.set("Key columns cannot be edited.")
+            return
+        
+        if self.result_sources[column_index] is None:
+            self.status_var.set("Only columns selected directly from the table can be edited, not aliases or expressions.")
+            return
+        
+        bbox = self.results_tree.bbox(item_id, column_ref)
+        if not bbox:
+            return
+        
+        self._close_cell_editor()
+        x, y, width, height = bbox
+        self.cell_editor = ttk.Entry(self.results_tree)
+        self.cell_editor_text = self.results_tree.set(item_id, column_index)
+        self.cell_editor.insert(0, self.cell_editor_text)
+        self.cell_editor.select_range(0, tk.END)
+        self.cell_editor.place(x=x, y=y, width=width, height=height)
+        self.cell_editor.focus_set()
+        
+        self.cell_editor.bind("<Return>", lambda e: self._commit_cell_edit(item_id, column_index))
+        self.cell_editor.bind("<FocusOut>", lambda e: self._commit_cell_edit(item_id, column_index))
+        self.cell_editor.bind("<Escape>", lambda e: self._close_cell_editor())
+        self.cell_editor.bind("<Control-Delete>", lambda e: self._set_cell_null(item_id, column_index))
+        
+        self.status_var.set("Enter: keep the edit | Esc: cancel | Ctrl+Delete: set NULL")
+    
+    def _commit_cell_edit(self, item_id: str, column_index: int) -> None:
+        """
+        Queues the value of the cell editor in the pending changeset.
+
+        Args:
+            item_id: Treeview item being edited
+            column_index: Index of the edited column
+        """
+        if not self.cell_editor:
+            return
+        
+        new_text = self.cell_editor.get()
+        self._close_cell_editor()
+        
+        # Leaving the editor without typing anything keeps the cell as it was
+        if new_text == self.cell_editor_text:
+            self._update_pending_status()
+            return
+        
+        declared_type = self.edit_column_types.get(self.result_sources[column_index], "")
+        self._queue_cell_change(item_id, column_index, self._convert_cell_value(new_text, declared_type))
+    
+    def _set_cell_null(self, item_id: str, column_index: int) -> None:
+        """
+        Queues NULL as the new value of the cell being edited.
+
+        Args:
+            item_id: Treeview item being edited
+            column_index: Index of the edited column
+        """
+        self._close_cell_editor()
+        self._queue_cell_change(item_id, column_index, None)
+    
+    def _queue_cell_change(self, item_id: str, column_index: int, new_value: Any) -> None:
+        """
+        Adds a cell value to the pending changeset.
+
+        Args:
+            item_id: Treeview item being edited
+            column_index: Index of the edited column
+            new_value: Value to be written to the database
+        """
+        original_value = self.result_rows[item_id][column_index]
+        
+        # Editing a cell back to its original value (and type) removes it from the changeset
+        if new_value == original_value and type(new_value) is type(original_value):
+            self.pending_changes.pop((item_id, column_index), None)
+        else:
+            self.pending_changes[(item_id, column_index)] = new_value
+        
+        self.results_tree.set(item_id, column_index, str(new_value) if new_value is not None else "")
+        self._refresh_row_tag(item_id)
+        self._update_pending_status()
+    
+    @staticmethod
+    def _convert_cell_value(text: str, declared_type: str) -> Union[int, float, str]:
+        """
+        Converts the text typed in a cell according to the column type affinity.
+
+        Args:
+            text: Text typed by the user
+            declared_type: Declared type of the column
+
+        Returns:
+            Union[int, float, str]: Value to be bound in the UPDATE
+        """
+        affinity = DatabaseManager.get_type_affinity(declared_type)
+        if affinity == "TEXT":
+            return text
+        
+        # Numeric columns accept any number SQLite would convert; untyped columns only plain literals
+        number = ApplicationUI._parse_number(text, strict=(affinity == "BLOB"))
+        if number is None:
+            return text
+        if affinity == "REAL":
+            return float(number)
+        if affinity in ("INTEGER", "NUMERIC") and isinstance(number, float) and number.is_integer():
+            return int(number)
+        return number
+    
+    @staticmethod
+    def _parse_number(value: str, strict: bool = True) -> Optional[Union[int, float]]:
+        """
+        Parses a decimal number literal.
+
+        Args:
+            value: Text to be parsed
+            strict: Accept only plain literals such as 42, -7 or 3.14.
+                Otherwise leading zeros, a plus sign and exponents are accepted too.
+
+        Returns:
+            Optional[Union[int, float]]: The number, or None if the text is not a number literal
+        """
+        if strict:
+            integer_pattern, float_pattern = r"-?(?:0|[1-9]\d*)", r"-?(?:0|[1-9]\d*)\.\d+"
+        else:
+            integer_pattern, float_pattern = r"\s*[+-]?\d+\s*", r"\s*[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?\s*"
+        
+        # Integers beyond the 64-bit range of SQLite are kept as text
+        if re.fullmatch(integer_pattern, value) and -2**63 <= int(value) < 2**63:
+            return int(value)
+        if re.fullmatch(float_pattern, value):
+            return float(value)
+        return None
+    
+    def _close_cell_editor(self) -> None:
+        """Removes the cell editor, if open, without saving."""
+        if self.cell_editor:
+            editor = self.cell_editor
+            self.cell_editor = None
+            editor.destroy()
+    
+    def _refresh_row_tag(self, item_id: str) -> None:
+        """Highlights a result row while it has pending changes."""
+        has_changes = any(item == item_id for item, _ in self.pending_changes)
+        self.results_tree.item(item_id, tags=("edited",) if has_changes else ())
+    
+    def _update_pending_status(self) -> None:
+        """Shows the size of the pending changeset in the status bar."""
+        if self.pending_changes:
+            self.status_var.set(f"{len(self.pending_changes)} pending change(s) on {self.edit_table}. Apply or discard them.")
+        else:
+            self.status_var.set("No pending changes.")
+    
+    def _apply_pending_changes(self) -> None:
+        """Applies the pending changeset to the database in a single transaction."""
+        self._close_cell_editor()
+        
+        if not self.pending_changes:
+            self.status_var.set("No pending changes to apply.")
+            return
+        
+        # Group the changes by column: each group becomes one executemany call
+        changes: Dict[str, List[Tuple]] = {}
+        for (item_id, column_index), new_value in self.pending_changes.items():
+            row = self.result_rows[item_id]
+            key_values = tuple(row[i] for i in self.edit_key_indices)
+            changes.setdefault(self.result_sources[column_index], []).append((new_value,) + key_values)
+        
+        success, message = self.db_manager.apply_changes(self.edit_table, self.edit_key_columns, changes)
+        
+        if success:
+            # The applied values become the new originals
+            for (item_id, column_index), new_value in self.pending_changes.items():
+                row = list(self.result_rows[item_id])
+                row[column_index] = new_value
+                self.result_rows[item_id] = tuple(row)
+            
+            edited_items = {item_id for item_id, _ in self.pending_changes}
+            self.pending_changes.clear()
+            for item_id in edited_items:
+                self._refresh_row_tag(item_id)
+            
+            self.status_var.set(message)
+        else:
+            messagebox.showerror("Erro SQL", message)
+            self.status_var.set("Error applying changes. Pending changes were kept.")
+    
+    def _review_pending_changes(self) -> None:
+        """Shows a summary of the pending changeset."""
+        self._close_cell_editor()
+        
+        if not self.pending_changes:
+            messagebox.showinfo("Pending Changes", "No pending changes.")
+            return
+        
+        max_lines = 20
+        lines = []
+        for (item_id, column_index), new_value in list(self.pending_changes.items())[:max_lines]:
+            row = self.result_rows[item_id]
+            key_text = ", ".join(f"{col}={row[i]}" for col, i in zip(self.edit_key_columns, self.edit_key_indices))
+            lines.append(f"[{key_text}] {self.result_sources[column_index]}: {row[column_index]!r} -> {new_value!r}")
+        
+        if len(self.pending_changes) > max_lines:
+            lines.append(f"... and {len(self.pending_changes) - max_lines} more.")
+        
+        messagebox.showinfo(
+            "Pending Changes",
+            f"{len(self.pending_changes)} pending change(s) on {self.edit_table}:\n\n" + "\n".join(lines)
+        )
+    
+    def _discard_pending_changes(self) -> None:
+        """Discards the pending changeset and restores the original values."""
+        self._close_cell_editor()
+        
+        if not self.pending_changes:
+            self.status_var.set("No pending changes to discard.")
+            return
+        
+        for item_id, column_index in self.pending_changes:
+            original_value = self.result_rows[item_id][column_index]
+            self.results_tree.set(item_id, column_index, str(original_value) if original_value is not None else "")
+            self.results_tree.item(item_id, tags=())
+        
+        self.pending_changes.clear()
+        self.status_var.set("Pending changes discarded.")
+    
+    def _confirm_discard_pending_changes(self) -> bool:
+        """
+        Asks the user whether pending changes may be discarded.
+
+        Returns:
+            bool: True if there are no pending changes or the user agreed to discard them
+        """
+        self._close_cell_editor()
+        
+        if not self.pending_changes:
+            return True
+        
+        return messagebox.askyesno(
+            "Pending Changes",
+            f"There are {len(self.pending_changes)} pending change(s) that have not been applied. Discard them?"
+        )
+    
+    def _reset_results_state(self) -> None:
+        """Clears the editing state of the results grid."""
+        self._close_cell_editor()
+        self.result_rows = {}
+        self.edit_table = None
+        self.edit_key_columns = []
+        self.edit_key_indices = []
+        self.result_sources = []
+        self.edit_column_types = {}
+        self.pending_changes = {}
+    
+    def _show_result_message(self, message: str) -> None:
+        """
+        Displays a message in the status bar and in the results tree.
+
+        Args:
+            message: Message to be displayed
+        """
+        self.status_var.set(message)
+        
+        # Configure the treeview with a single column to display the message
+        for col in self.results_tree["columns"]:
+            self.results_tree.heading(col, text="")
+        
+        for item in self.results_tree.get_children():
+            self.results_tree.delete(item)
+        
+        self.results_tree["columns"] = ["message"]
+        self.results_tree.heading("message", text="Mensagem")
+        self.results_tree.column("message", width=400)
+        self.results_tree.insert("", tk.END, values=[message])
+    
+    def _open_parameters_form(self) -> None:
+        """Opens a form to fill in the parameters of the current query."""
+        # Only one form at a time
+        if self.parameters_form and self.parameters_form.winfo_exists():
+            self.parameters_form.lift()
+            self.parameters_form.focus_set()
+            return
+        
+        if not self.db_manager.current_db_path:
+            messagebox.showwarning("Warning", "No database open.")
+            return
+        
+        query = self.query_text.get(1.0, tk.END).strip()
+        parameter_names = self.db_manager.get_query_parameters(query)
+        
+        if not parameter_names:
+            messagebox.showinfo("Parameters", "The query has no parameters (e.g. :name or ?).")
+            return
+        
+        if not self._check_parameters(parameter_names):
+            return
+        
+        # The form is modal and works on the query captured here, so the query cannot change while it is open
+        form = ttk.Toplevel(title="Query Parameters")
+        form.transient(self.root)
+        self.parameters_form = form
+        
+        def close_form() -> None:
+            self.parameters_form = None
+            form.destroy()
+        
+        form.protocol("WM_DELETE_WINDOW", close_form)
+        
+        form_frame = ttk.Frame(form, padding=10)
+        form_frame.pack(fill=BOTH, expand=YES)
+        form_frame.grid_columnconfigure(2, weight=1)
+        
+        # One type selector and entry per parameter, filled with the last values used
+        types: Dict[str, ttk.Combobox] = {}
+        entries: Dict[str, ttk.Entry] = {}
+        for row, name in enumerate(parameter_names):
+            param_type, value = self.query_params.get(name, ("Auto", ""))
+            ttk.Label(form_frame, text=name).grid(row=row, column=0, sticky=W, padx=5, pady=2)
+            types[name] = ttk.Combobox(form_frame, values=self.PARAMETER_TYPES, state="readonly", width=6)
+            types[name].set(param_type)
+            types[name].grid(row=row, column=1, padx=5, pady=2)
+            entries[name] = ttk.Entry(form_frame, width=40)
+            entries[name].insert(0, value)
+            entries[name].grid(row=row, column=2, sticky="ew", padx=5, pady=2)
+        
+        # Batch mode: one parameter set per line
+        batch_row = len(parameter_names)
+        ttk.Label(
+            form_frame,
+            text=f"Batch (one set per line, comma-separated, NULL for null: {', '.join(parameter_names)}):"
+        ).grid(row=batch_row, column=0, columnspan=3, sticky=W, padx=5, pady=(10, 2))
+        
+        batch_text = tk.Text(form_frame, height=8, width=60, font=("Consolas", 11))
+        batch_text.grid(row=batch_row + 1, column=0, columnspan=3, sticky="nsew", padx=5, pady=2)
+        form_frame.grid_rowconfigure(batch_row + 1, weight=1)
+        
+        def save_values() -> None:
+            for name in parameter_names:
+                self.query_params[name] = (types[name].get(), entries[name].get())
+        
+        def execute_single() -> None:
+            save_values()
+            close_form()
+            self._run_query(query, self._bind_parameters(parameter_names))
+        
+        def execute_batch() -> None:
+            save_values()
+            if self._execute_batch(query, parameter_names, batch_text.get(1.0, tk.END)):
+                close_form()
+        
+        form_buttons = ttk.Frame(form_frame)
+        form_buttons.grid(row=batch_row + 2, column=0, columnspan=3, sticky="ew", pady=(10, 0))
+        
+        ttk.Button(form_buttons, text="Execute", bootstyle="primary", command=execute_single).pack(side=LEFT, padx=5)
+        ttk.Button(form_buttons, text="Execute Batch", bootstyle="primary-outline", command=execute_batch).pack(side=LEFT, padx=5)
+        ttk.Button(form_buttons, text="Cancel", bootstyle="secondary-outline", command=close_form).pack(side=LEFT, padx=5)
+        
+        form.bind("<Escape>", lambda e: close_form())
+        entries[parameter_names[0]].focus_set()
+        form.grab_set()
+    
+    def _execute_batch(self, query: str, parameter_names: List[str], batch_input: str) -> bool:
+        """
+        Executes a query once per line of parameter values using executemany.
+
+        Args:
+            query: SQL query with parameters
+            parameter_names: Names of the parameters, in the order of the values on each line
+            batch_input: Comma-separated values, one parameter set per line
+
+        Returns:
+            bool: True if the batch was executed, False otherwise
+        """
+        lines = [line for line in batch_input.splitlines() if line.strip()]
+        if not lines:
+            messagebox.showwarning("Warning", "Empty batch.")
+            return False
+        
+        param_sets: List[Union[Dict[str, Any], Tuple]] = []
+        for line_number, values in enumerate(csv.reader(lines, skipinitialspace=True), start=1):
+            if len(values) != len(parameter_names):
+                messagebox.showwarning(
+                    "Warning",
+                    f"Line {line_number} has {len(values)} value(s), expected {len(parameter_names)}."
+                )
+                return False
+            param_sets.append(self._bind_parameters(parameter_names, values))
+        
+        if not self._confirm_discard_pending_changes():
+            return False
+        
+        success, message = self.db_manager.execute_many(query, param_sets)
+        
+        if success:
+            self._reset_results_state()
+            self._show_result_message(message)
+            return True
+        
+        messagebox.showerror("Erro SQL", message)
+        self.status_var.set("Erro ao executar lote.")
+        return False
+    
+    def _check_parameters(self, parameter_names: List[str]) -> bool:
+        """
+        Checks that a query does not mix positional and named parameters, nor reuse a name with another prefix.
+
+        Args:
+            parameter_names: Parameters of the query, as returned by get_query_parameters
+
+        Returns:
+            bool: True if the parameters can be bound, False otherwise
+        """
+        positional = [name for name in parameter_names if name.startswith("?")]
+        if positional and len(positional) != len(parameter_names):
+            messagebox.showwarning("Warning", "Mixing positional (?) and named (:name, @name, $name) parameters is not supported.")
+            return False
+        
+        # sqlite3 binds :id, @id and $id from the same value, so they would silently share it
+        bare_names = [name[1:] for name in parameter_names if not name.startswith("?")]
+        if len(set(bare_names)) != len(bare_names):
+            messagebox.showwarning("Warning", "Named parameters that differ only in their prefix (e.g. :id and @id) are not supported.")
+            return False
+        return True
+    
+    def _bind_parameters(self, parameter_names: List[str], batch_values: Optional[List[str]] = None) -> Union[Dict[str, Any], Tuple]:
+        """
+        Gets the values to bind to the parameters of a query.
+
+        Args:
+            parameter_names: Parameters of the query, as returned by get_query_parameters
+            batch_values: Values of a batch line, in parameter order. The last form values are used when omitted.
+
+        Returns:
+            Union[Dict[str, Any], Tuple]: Values by name for named parameters, or by index for positional ones
+        """
+        if batch_values is None:
+            values = {name: self._convert_parameter_value(*self.query_params[name]) for name in parameter_names}
+        else:
+            values = {
+                name: self._convert_parameter_value(self.query_params[name][0], value, batch=True)
+                for name, value in zip(parameter_names, batch_values)
+            }
+        
+        if parameter_names[0].startswith("?"):
+            size = max(int(name[1:]) for name in parameter_names)
+            return tuple(values.get(f"?{index}") for index in range(1, size + 1))
+        
+        # sqlite3 looks named parameters up without their prefix
+        return {name[1:]: value for name, value in values.items()}
+    
+    @staticmethod
+    def _format_parameters(params: Union[Dict[str, Any], Tuple]) -> str:
+        """
+        Formats bound parameter values for display.
+
+        Args:
+            params: Values bound to the parameters
+
+        Returns:
+            str: Text such as "id=5, name='Ana'" or "?1=5, ?2='Ana'"
+        """
+        if isinstance(params, tuple):
+            return ", ".join(f"?{index}={value!r}" for index, value in enumerate(params, start=1))
+        return ", ".join(f"{name}={value!r}" for name, value in params.items())
+    
+    @staticmethod
+    def _convert_parameter_value(param_type: str, value: str, batch: bool = False) -> Union[int, float, str, None]:
+        """
+        Converts a parameter typed in the form according to its type.
+
+        Args:
+            param_type: One of PARAMETER_TYPES
+            value: Value typed by the user
+            batch: Whether the value comes from a batch line, where NULL binds a null in Auto mode
+
+        Returns:
+            Union[int, float, str, None]: Value to be bound
+        """
+        if param_type == "NULL" or (batch and param_type == "Auto" and value == "NULL"):
+            return None
+        if param_type == "Text":
+            return value
+        
+        # Only plain literals become numbers: "007", "1e3", "nan" or "inf" stay text
+        number = ApplicationUI._parse_number(value)
+        return number if number is not None else value
+    
     def _setup_bottom_section(self) -> None:
         """Sets up the bottom section if needed."""
         # This section is not needed according to the original layout